@@ -1,13 +1,31 @@
 import streamlit as st
-from simplified_binance_futures_bot import BinanceFuturesRest
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 st.set_page_config(page_title="Trading Bot UI", layout="centered")
 
+
+@st.cache_resource
+def get_bot(api_key, api_secret, transport="REST"):
+    # Reuse the client across Streamlit reruns instead of rebuilding it per click.
+    # Imported here so reruns that don't place an order skip loading the bot module.
+    from simplified_binance_futures_bot import BinanceFuturesRest, BinanceFuturesWS
+    if transport == "WebSocket":
+        return BinanceFuturesWS(api_key, api_secret)
+    return BinanceFuturesRest(api_key, api_secret)
+
+
+@st.cache_resource
+def get_executor():
+    # Shared across reruns and sessions; order round trips run here instead of on the script thread
+    return ThreadPoolExecutor(max_workers=8)
+
+
 st.title("💹 Simplified Binance Futures Trading Bot (Testnet)")
 
 api_key = st.text_input("Enter API Key", type="password")
 api_secret = st.text_input("Enter API Secret", type="password")
+transport = st.selectbox("Connection", ["REST", "WebSocket"])
 symbol = st.text_input("Symbol", "BTCUSDT")
 side = st.selectbox("Order Side", ["BUY", "SELL"])
 order_type = st.selectbox("Order Type", ["MARKET", "LIMIT", "STOP-LIMIT"])
@@ -23,17 +41,24 @@ if order_type == "STOP-LIMIT":
     stop_price = st.number_input("Stop Price", min_value=0.0, value=68800.0, step=100.0)
 
 if st.button("📈 Place Order"):
+    from simplified_binance_futures_bot import SYMBOL_RE
+    symbol = symbol.strip().upper()
     if not api_key or not api_secret:
         st.error("Please enter both API Key and Secret.")
+    elif not SYMBOL_RE.fullmatch(symbol):
+        st.error("Symbol must contain only letters and digits, e.g. BTCUSDT.")
     else:
-        bot = BinanceFuturesRest(api_key, api_secret)
+        bot = get_bot(api_key, api_secret, transport)
         try:
             if order_type == "MARKET":
-                resp = bot.place_market_order(symbol, side, quantity)
+                future = get_executor().submit(bot.place_market_order, symbol, side, quantity)
             elif order_type == "LIMIT":
-                resp = bot.place_limit_order(symbol, side, quantity, price)
+                future = get_executor().submit(bot.place_limit_order, symbol, side, quantity, price)
             else:
-                resp = bot.place_stop_limit_order(symbol, side, quantity, stop_price, price)
+                future = get_executor().submit(bot.place_stop_limit_order, symbol, side, quantity, stop_price, price)
+
+            with st.spinner("Placing order..."):
+                resp = future.result()
 
             st.success("✅ Order Placed Successfully!")
             st.json(resp)
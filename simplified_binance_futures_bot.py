@@ -13,151 +13,587 @@ How to use:
 2. Run this script with --api-key and --api-secret or set environment variables BINANCE_API_KEY and BINANCE_API_SECRET.
 3. Example:
    python simplified_binance_futures_bot.py market --symbol BTCUSDT --side BUY --quantity 0.001 --api-key YOUR_KEY --api-secret YOUR_SECRET
+4. To place many orders at once (concurrently, up to 10 orders/s), list them in a CSV with columns
+   symbol,side,type,quantity,price,stop and run:
+   python simplified_binance_futures_bot.py batch --file orders.csv
 
 Note: This script uses the testnet base URL: https://testnet.binancefuture.com
 
 """
 
 import argparse
+import asyncio
+import atexit
+import csv
+import functools
 import os
+import queue
+import re
+import socket
+import threading
 import time
+import uuid
 import hmac
 import hashlib
+import json
 import logging
-import requests
-from urllib.parse import urlencode
+import logging.handlers
+import ssl
+import httpx
+from collections import OrderedDict
+from decimal import Decimal
+from urllib.parse import parse_qsl, urlencode
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    _loads = lambda b: json.loads(b.decode('utf-8'))
+
+try:
+    # cryptography calls OpenSSL's HMAC directly, with less Python-level dispatch than the hmac module
+    from cryptography.hazmat.primitives import hashes, hmac as chmac
+except ImportError:  # optional; fall back to the stdlib hmac module
+    chmac = None
 
 # --- Configuration ---
 TESTNET_BASE = "https://testnet.binancefuture.com"
+TESTNET_WS_API = "wss://testnet.binancefuture.com/ws-fapi/v1"
 API_ORDER_PATH = "/fapi/v1/order"
 API_TIME_PATH = "/fapi/v1/time"
+API_EXCHANGE_INFO_PATH = "/fapi/v1/exchangeInfo"
+EXCHANGE_INFO_TTL = 3600  # seconds to reuse symbol filters (tick/step sizes)
 LOGFILE = "bot.log"
+ORDERS_PER_SECOND = 10  # Binance futures order rate limit
+TIME_SYNC_INTERVAL = 300  # seconds between server-time offset resyncs
+TIME_SYNC_SAMPLES = 4
+FAILED_LOOKUP_TTL = 30  # seconds before retrying a failed time sync / exchangeInfo fetch
+SYMBOL_RE = re.compile(r"[A-Z0-9]+")  # order bodies are built without percent-encoding, so symbols must match this
+RESPONSE_PEEK_BYTES = 4096  # max bytes of a response body decoded for logs/error messages
+
+# SHA-256 from OpenSSL's EVP backend (uses SHA-NI / ARMv8 SHA2 instructions where the CPU has them)
+_SHA256 = hashlib.sha256
 
 # --- Logging setup ---
 logger = logging.getLogger("SimplifiedBinanceBot")
 logger.setLevel(logging.DEBUG)
-formatter = logging.Formatter("%(asctime)s | %(levelname)s | %(message)s")
-
-fh = logging.FileHandler(LOGFILE)
-fh.setLevel(logging.DEBUG)
-fh.setFormatter(formatter)
 
-ch = logging.StreamHandler()
-ch.setLevel(logging.INFO)
-ch.setFormatter(formatter)
 
-logger.addHandler(fh)
-logger.addHandler(ch)
+def _configure_logging():
+    # Called lazily (CLI entry point / client construction) so importing the module doesn't open bot.log.
+    # Records go through a queue; a listener thread does the file/console I/O off the order path.
+    if logger.handlers:
+        return
+    formatter = logging.Formatter("%(asctime)s | %(levelname)s | %(message)s")
+
+    fh = logging.FileHandler(LOGFILE)
+    fh.setLevel(logging.DEBUG)
+    fh.setFormatter(formatter)
+
+    ch = logging.StreamHandler()
+    ch.setLevel(logging.INFO)
+    ch.setFormatter(formatter)
+
+    q = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(q, fh, ch, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    logger.addHandler(logging.handlers.QueueHandler(q))
+    logger.debug("OpenSSL: %s", ssl.OPENSSL_VERSION)
+
+
+# --- HTTP client ---
+# One pooled HTTP/2 client shared by all clients: the TCP+TLS handshake is paid once and concurrent
+# requests (time sync, orders) are multiplexed as streams on the same connection.
+# API keys are sent per request (not stored on the client), so clients with different keys can share it.
+# Transport retries only cover failed connection attempts; order POSTs are never resent.
+# Signed order bodies are a few hundred bytes, so disable Nagle (and delayed ACKs where supported)
+# to avoid 40 ms stalls on small writes.
+_SOCKET_OPTIONS = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+if hasattr(socket, 'TCP_QUICKACK'):  # Linux only
+    _SOCKET_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1))
+
+_CLIENT = httpx.Client(
+    timeout=5.0,
+    transport=httpx.HTTPTransport(
+        http2=True,
+        retries=2,
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=10),
+        socket_options=_SOCKET_OPTIONS
+    )
+)
+
+
+class _TTLCache:
+    """Small thread-safe TTL + LRU memo for idempotent lookups (server time, exchange info, ...)."""
+
+    def __init__(self, maxsize: int = 128):
+        self._data = OrderedDict()  # key -> (expires_at, value)
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+
+    def get_or_fetch(self, key, ttl: float, fn):
+        now = time.monotonic()
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is not None and hit[0] > now:
+                self._data.move_to_end(key)
+                return hit[1]
+
+        # Fetch outside the lock so a slow request doesn't block other keys
+        value = fn()
+        self.put(key, value, ttl)
+        return value
+
+    def get(self, key, default=None, stale_ok: bool = False):
+        # Lookup without fetching; `stale_ok` also returns entries past their TTL
+        with self._lock:
+            hit = self._data.get(key)
+        if hit is None or (not stale_ok and hit[0] <= time.monotonic()):
+            return default
+        return hit[1]
+
+    def put(self, key, value, ttl: float):
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+
+_CACHE = _TTLCache()
 
 
 class BinanceFuturesRest:
     def __init__(self, api_key: str, api_secret: str, base_url: str = TESTNET_BASE):
+        _configure_logging()
         self.api_key = api_key
         self.api_secret = api_secret.encode('utf-8')
+        # Keyed HMAC state computed once; copied per signature to skip the key-pad setup
+        if chmac is not None:
+            self._hmac_template = chmac.HMAC(self.api_secret, hashes.SHA256())
+        else:
+            self._hmac_template = hmac.new(self.api_secret, digestmod=_SHA256)
         self.base = base_url.rstrip("/")
-        self.session = requests.Session()
-        self.session.headers.update({
+        self._client = _CLIENT
+        self.headers = {
             'X-MBX-APIKEY': self.api_key,
             'Content-Type': 'application/x-www-form-urlencoded'
-        })
+        }
 
-    def _get_timestamp(self):
-        # Use server time to avoid invalid timestamp issues
-        try:
-            r = self.session.get(self.base + API_TIME_PATH, timeout=5)
+    def _cached_get(self, path: str, ttl: float, params: dict = None):
+        # Unsigned GET memoized for `ttl` seconds; only use for idempotent public endpoints
+        query = urlencode(params or {}, doseq=True)
+        url = self.base + path + ("?" + query if query else "")
+
+        def fetch():
+            r = self._client.get(url)
             r.raise_for_status()
-            server_time = r.json().get('serverTime')
-            if server_time:
-                return int(server_time)
-        except Exception as e:
-            logger.warning(f"Could not fetch server time: {e} — falling back to local time")
-        return int(time.time() * 1000)
+            return _loads(r.content)
 
-    def _sign(self, data: dict) -> str:
-        query_string = urlencode(data, doseq=True)
-        signature = hmac.new(self.api_secret, query_string.encode('utf-8'), hashlib.sha256).hexdigest()
-        return signature
+        return _CACHE.get_or_fetch(url, ttl, fetch)
 
-    def _send_signed(self, method: str, path: str, payload: dict):
+    def _symbol_precision(self, symbol: str):
+        """Return (step_size, tick_size) strings for `symbol`, or (None, None) if unknown."""
+        def build():
+            # exchangeInfo lists every symbol; only the reduced filter map is cached, not the response
+            r = self._client.get(self.base + API_EXCHANGE_INFO_PATH)
+            r.raise_for_status()
+            info = _loads(r.content)
+            precision = {}
+            for sym in info.get('symbols', []):
+                filters = {f['filterType']: f for f in sym.get('filters', [])}
+                step = filters.get('LOT_SIZE', {}).get('stepSize')
+                tick = filters.get('PRICE_FILTER', {}).get('tickSize')
+                precision[sym['symbol']] = (step, tick)
+            return precision
+
+        key = (self.base, 'precision')
+        try:
+            precision = _CACHE.get_or_fetch(key, EXCHANGE_INFO_TTL, build)
+        except Exception as e:
+            # Cache the miss briefly so every order doesn't re-download exchangeInfo while it's down
+            logger.warning(f"Could not fetch exchange info: {e} — using default number formatting")
+            precision = {}
+            _CACHE.put(key, precision, FAILED_LOOKUP_TTL)
+        return precision.get(symbol, (None, None))
+
+    def _sync_time_offset(self) -> int:
+        # Cristian's algorithm: offset = serverTime - (t1 + t3) / 2, keeping the lowest-RTT sample
+        offset = None
+        best_rtt = None
+        for _ in range(TIME_SYNC_SAMPLES):
+            try:
+                t1 = time.time() * 1000
+                r = self._client.get(self.base + API_TIME_PATH)
+                t3 = time.time() * 1000
+                r.raise_for_status()
+                server_time = _loads(r.content).get('serverTime')
+            except Exception as e:
+                logger.warning(f"Could not fetch server time: {e}")
+                continue
+            if not server_time:
+                continue
+            rtt = t3 - t1
+            if best_rtt is None or rtt < best_rtt:
+                best_rtt = rtt
+                offset = int(server_time - (t1 + t3) / 2)
+
+        if offset is None:
+            raise ConnectionError("server time unavailable")
+        logger.debug(f"Server time offset: {offset} ms (rtt={best_rtt:.1f} ms)")
+        return offset
+
+    def _get_timestamp(self):
+        # Use server time to avoid invalid timestamp issues; the cached offset is resampled every TIME_SYNC_INTERVAL
+        key = (self.base, 'time')
+        try:
+            offset = _CACHE.get_or_fetch(key, TIME_SYNC_INTERVAL, self._sync_time_offset)
+        except Exception as e:
+            # Use local time for now, but retry the sync soon rather than after a full interval
+            logger.warning(f"Could not sync server time: {e} — falling back to local time")
+            offset = 0
+            _CACHE.put(key, offset, FAILED_LOOKUP_TTL)
+        return int(time.time() * 1000) + offset
+
+    def _sign_bytes(self, query: bytes) -> str:
+        h = self._hmac_template.copy()
+        h.update(query)
+        return h.finalize().hex() if chmac is not None else h.hexdigest()
+
+    def _signed_body(self, query: bytes, timestamp: int = None) -> bytes:
+        # Timestamped at send time, so a request queued behind the rate limiter can't outlive recvWindow
+        if timestamp is None:
+            timestamp = self._get_timestamp()
+        query = b"".join((query, b"&timestamp=", str(timestamp).encode('ascii')))
+        return b"".join((query, b"&signature=", self._sign_bytes(query).encode('ascii')))
+
+    def _send_query(self, method: str, path: str, query: bytes):
+        # `query` is an already-encoded query string; the timestamp and signature are appended here
         url = self.base + path
-        payload['timestamp'] = self._get_timestamp()
-        signature = self._sign(payload)
-        payload['signature'] = signature
-        body = urlencode(payload, doseq=True)
+        body = self._signed_body(query)
 
-        logger.debug(f"REQUEST -> {method} {url} | body: {body}")
+        logger.debug("REQUEST -> %s %s | body: %s", method, url, body.decode('ascii'))
         try:
-            if method.upper() == 'POST':
-                r = self.session.post(url, data=body, timeout=10)
-            elif method.upper() == 'DELETE':
-                r = self.session.delete(url, data=body, timeout=10)
+            if method.upper() in ('POST', 'DELETE'):
+                r = self._client.request(method.upper(), url, content=body, headers=self.headers, timeout=10)
             else:
-                r = self.session.get(url, params=payload, timeout=10)
+                r = self._client.get(url + "?" + body.decode('ascii'), headers=self.headers, timeout=10)
 
-            logger.debug(f"RESPONSE [{r.status_code}] -> {r.text}")
+            logger.debug("RESPONSE [%s] -> %s", r.status_code, _peek_text(r.content))
             r.raise_for_status()
-            return r.json()
-        except requests.HTTPError as he:
-            try:
-                err = r.json()
-            except Exception:
-                err = r.text
-            logger.error(f"HTTP error: {he} | response: {err}")
+            return _loads(r.content)
+        except httpx.HTTPStatusError as he:
+            logger.error(f"HTTP error: {he} | response: {_peek_error(r.content)}")
             raise
         except Exception as e:
             logger.error(f"Network/Error: {e}")
             raise
 
     # Public wrappers
+    # Order bodies are built directly from fixed templates: symbols and sides are plain ASCII,
+    # numbers are plain fixed-point decimals, so none of the values need percent-encoding.
+    # Bodies are encoded to bytes once and signed/sent as-is.
     def place_market_order(self, symbol: str, side: str, quantity: float, reduceOnly: bool = False, timeInForce: str = None):
-        payload = {
-            'symbol': symbol,
-            'side': side,
-            'type': 'MARKET',
-            'quantity': self._fmt_qty(quantity),
-            'reduceOnly': str(reduceOnly).lower()
-        }
-        return self._send_signed('POST', API_ORDER_PATH, payload)
+        step, _ = self._symbol_precision(symbol)
+        body = (f"symbol={symbol}&side={side}&type=MARKET"
+                f"&quantity={self._fmt_qty(quantity, step)}"
+                f"&reduceOnly={'true' if reduceOnly else 'false'}").encode('ascii')
+        return self._send_query('POST', API_ORDER_PATH, body)
 
     def place_limit_order(self, symbol: str, side: str, quantity: float, price: float, timeInForce: str = 'GTC', reduceOnly: bool = False):
-        payload = {
-            'symbol': symbol,
-            'side': side,
-            'type': 'LIMIT',
-            'timeInForce': timeInForce,
-            'quantity': self._fmt_qty(quantity),
-            'price': self._fmt_price(price),
-            'reduceOnly': str(reduceOnly).lower()
-        }
-        return self._send_signed('POST', API_ORDER_PATH, payload)
+        step, tick = self._symbol_precision(symbol)
+        body = (f"symbol={symbol}&side={side}&type=LIMIT&timeInForce={timeInForce}"
+                f"&quantity={self._fmt_qty(quantity, step)}&price={self._fmt_price(price, tick)}"
+                f"&reduceOnly={'true' if reduceOnly else 'false'}").encode('ascii')
+        return self._send_query('POST', API_ORDER_PATH, body)
 
     def place_stop_limit_order(self, symbol: str, side: str, quantity: float, stopPrice: float, price: float, timeInForce: str = 'GTC', reduceOnly: bool = False):
         # Implemented using STOP (STOP_MARKET / STOP_LOSS_LIMIT variants exist) for futures endpoint
         # We'll use STOP as "STOP" + LIMIT as type STOP with price & stopPrice where supported.
-        payload = {
-            'symbol': symbol,
-            'side': side,
-            'type': 'STOP',
-            'quantity': self._fmt_qty(quantity),
-            'stopPrice': self._fmt_price(stopPrice),
-            'price': self._fmt_price(price),
-            'timeInForce': timeInForce,
-            'reduceOnly': str(reduceOnly).lower()
-        }
-        return self._send_signed('POST', API_ORDER_PATH, payload)
+        step, tick = self._symbol_precision(symbol)
+        body = (f"symbol={symbol}&side={side}&type=STOP"
+                f"&quantity={self._fmt_qty(quantity, step)}"
+                f"&stopPrice={self._fmt_price(stopPrice, tick)}&price={self._fmt_price(price, tick)}"
+                f"&timeInForce={timeInForce}"
+                f"&reduceOnly={'true' if reduceOnly else 'false'}").encode('ascii')
+        return self._send_query('POST', API_ORDER_PATH, body)
 
     @staticmethod
-    def _fmt_qty(q):
-        # Binance expects string numbers; CLI provides float — keep a reasonable precision
-        return format(float(q), 'f')
+    def _fmt_qty(q, step=None):
+        # Binance expects string numbers; like prices, quantities off the step size are rejected
+        # rather than rounded, so the order placed is always the size requested
+        if step is None:
+            return format(float(q), 'f')
+        d = Decimal(str(q))
+        if d % Decimal(step) != 0:
+            raise ValueError(f"quantity {q} is not a multiple of the step size {step}")
+        return f"{d:.{_decimals(step)}f}"
 
     @staticmethod
-    def _fmt_price(p):
-        return format(float(p), 'f')
+    def _fmt_price(p, tick=None):
+        # Prices are never rounded: one off the tick size is rejected rather than moved
+        if tick is None:
+            return format(float(p), 'f')
+        d = Decimal(str(p))
+        if d % Decimal(tick) != 0:
+            raise ValueError(f"price {p} is not a multiple of the tick size {tick}")
+        return f"{d:.{_decimals(tick)}f}"
+
+
+def _decimals(step):
+    # "0.00100000" -> 3, "1" -> 0; None when the filter is missing
+    if not step:
+        return None
+    frac = step.rstrip('0').partition('.')[2] if '.' in step else ''
+    return len(frac)
+
+
+def _peek_text(content: bytes) -> str:
+    # Decode at most RESPONSE_PEEK_BYTES; gateway/Cloudflare error pages can be tens of KB of HTML
+    return content[:RESPONSE_PEEK_BYTES].decode('utf-8', 'replace')
+
+
+def _peek_error(content: bytes):
+    # Binance errors are small JSON ({"code": ..., "msg": ...}); anything else is shown as text
+    try:
+        return _loads(content[:RESPONSE_PEEK_BYTES])
+    except Exception:
+        return _peek_text(content)
+
+
+class _RateLimiter:
+    """Token bucket: at most `rate` acquisitions per `period` seconds."""
+
+    def __init__(self, rate: int = ORDERS_PER_SECOND, period: float = 1.0):
+        self._sem = asyncio.Semaphore(rate)
+        self._period = period
+
+    async def __aenter__(self):
+        await self._sem.acquire()
+        # Return the token one period later rather than when the request finishes
+        asyncio.get_running_loop().call_later(self._period, self._sem.release)
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class BinanceFuturesAsync(BinanceFuturesRest):
+    """asyncio variant of the REST client for placing many orders concurrently.
+
+    The `place_*_order` wrappers return coroutines; use `place_orders_bulk` to
+    overlap the network round trips of several orders.
+    """
+
+    def __init__(self, api_key: str, api_secret: str, base_url: str = TESTNET_BASE):
+        super().__init__(api_key, api_secret, base_url)
+        self._aio_session = None
+        self._limiter = None
+
+    def _get_aio_session(self):
+        # One long-lived session per client; a fresh session per call is slower than a blocking client
+        if self._aio_session is None or self._aio_session.closed:
+            # Imported on first use so REST-only runs don't need (or pay to load) aiohttp
+            import aiohttp
+            connector = aiohttp.TCPConnector(limit=50, ttl_dns_cache=300, keepalive_timeout=75)
+            self._aio_session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+            self._limiter = _RateLimiter()
+        return self._aio_session
+
+    async def close(self):
+        if self._aio_session is not None and not self._aio_session.closed:
+            await self._aio_session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def _refresh_lookups(self, symbol: str = None):
+        # Time sync and exchangeInfo use the blocking HTTP client; run them in a worker thread,
+        # never on the event loop, whenever the cached value is missing or expired
+        if _CACHE.get((self.base, 'time')) is None:
+            await asyncio.to_thread(self._get_timestamp)
+        if symbol is not None and _CACHE.get((self.base, 'precision')) is None:
+            await asyncio.to_thread(self._symbol_precision, symbol)
+
+    # Same signatures as the REST wrappers; lookups are refreshed off-loop before the body is built
+    async def place_market_order(self, symbol: str, side: str, quantity: float, reduceOnly: bool = False, timeInForce: str = None):
+        await self._refresh_lookups(symbol)
+        return await super().place_market_order(symbol, side, quantity, reduceOnly, timeInForce)
+
+    async def place_limit_order(self, symbol: str, side: str, quantity: float, price: float, timeInForce: str = 'GTC', reduceOnly: bool = False):
+        await self._refresh_lookups(symbol)
+        return await super().place_limit_order(symbol, side, quantity, price, timeInForce, reduceOnly)
+
+    async def place_stop_limit_order(self, symbol: str, side: str, quantity: float, stopPrice: float, price: float, timeInForce: str = 'GTC', reduceOnly: bool = False):
+        await self._refresh_lookups(symbol)
+        return await super().place_stop_limit_order(symbol, side, quantity, stopPrice, price, timeInForce, reduceOnly)
+
+    async def _send_query(self, method: str, path: str, query: bytes):
+        import aiohttp
+        url = self.base + path
+        session = self._get_aio_session()
+        content = b""  # session.request can raise ClientResponseError subclasses before a body is read
+
+        await self._refresh_lookups()
+        try:
+            async with self._limiter:
+                # Sign with the cached offset even if it expired while queued; the next order refreshes it
+                offset = _CACHE.get((self.base, 'time'), 0, stale_ok=True)
+                body = self._signed_body(query, int(time.time() * 1000) + offset)
+                logger.debug("REQUEST -> %s %s | body: %s", method, url, body.decode('ascii'))
+                if method.upper() in ('POST', 'DELETE'):
+                    r = await session.request(method.upper(), url, data=body)
+                else:
+                    r = await session.get(url + "?" + body.decode('ascii'))
+                async with r:
+                    content = await r.read()
+                    logger.debug("RESPONSE [%s] -> %s", r.status, _peek_text(content))
+                    r.raise_for_status()
+                    return _loads(content)
+        except aiohttp.ClientResponseError as he:
+            logger.error(f"HTTP error: {he} | response: {_peek_error(content)}")
+            raise
+        except Exception as e:
+            logger.error(f"Network/Error: {e}")
+            raise
+
+    async def place_orders_bulk(self, orders):
+        """Place several orders concurrently.
+
+        Each order is a dict with a `type` of MARKET, LIMIT or STOP_LIMIT plus the
+        keyword arguments of the matching `place_*_order` method. Returns one result
+        per order, in order; failed orders yield their exception instead of a response.
+        """
+        # Warm the server-time offset and symbol filters up front so the concurrent orders don't each fetch them
+        await self._refresh_lookups('')
+
+        placers = {
+            'MARKET': self.place_market_order,
+            'LIMIT': self.place_limit_order,
+            'STOP_LIMIT': self.place_stop_limit_order,
+        }
+        async def place(order):
+            # Inside a coroutine so validation errors are reported per order rather than aborting the batch
+            params = dict(order)
+            order_type = params.pop('type').upper().replace('-', '_')
+            return await placers[order_type](**params)
+
+        return await asyncio.gather(*(place(order) for order in orders), return_exceptions=True)
+
+
+# REST (method, path) -> WebSocket API method
+_WS_METHODS = {
+    ('POST', API_ORDER_PATH): 'order.place',
+    ('DELETE', API_ORDER_PATH): 'order.cancel',
+    ('GET', API_ORDER_PATH): 'order.status',
+}
+
+
+class BinanceFuturesWS(BinanceFuturesRest):
+    """Client that places orders over one persistent WebSocket API connection.
+
+    Exposes the same blocking `place_*_order` methods as `BinanceFuturesRest`; each
+    order is sent as a single signed JSON frame instead of an HTTPS POST. The
+    connection lives on a background event loop thread and responses are matched
+    to requests by id. Endpoints without a WebSocket equivalent still use REST.
+    """
+
+    def __init__(self, api_key: str, api_secret: str, base_url: str = TESTNET_BASE, ws_url: str = TESTNET_WS_API):
+        super().__init__(api_key, api_secret, base_url)
+        self.ws_url = ws_url
+        self._ws = None
+        self._pending = {}  # request id -> asyncio.Future
+        self._connect_lock = asyncio.Lock()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="binance-ws", daemon=True)
+        self._thread.start()
+
+    async def _connect(self):
+        async with self._connect_lock:
+            if self._ws is None:
+                import websockets  # imported on first use, like aiohttp in BinanceFuturesAsync
+                self._ws = await websockets.connect(self.ws_url, ping_interval=30)
+                self._loop.create_task(self._read_responses(self._ws))
+        return self._ws
+
+    async def _read_responses(self, ws):
+        try:
+            async for msg in ws:
+                data = _loads(msg.encode('utf-8') if isinstance(msg, str) else msg)
+                fut = self._pending.pop(data.get('id'), None)
+                if fut is not None and not fut.done():
+                    fut.set_result(data)
+        except Exception as e:
+            logger.warning(f"WebSocket connection closed: {e}")
+        finally:
+            if self._ws is ws:
+                self._ws = None
+            for fut in self._pending.values():
+                if not fut.done():
+                    fut.set_exception(ConnectionError("WebSocket connection closed"))
+            self._pending.clear()
+
+    async def _request(self, ws_method: str, params: dict):
+        ws = await self._connect()
+        req_id = uuid.uuid4().hex
+        fut = self._loop.create_future()
+        self._pending[req_id] = fut
+        try:
+            await ws.send(json.dumps({'id': req_id, 'method': ws_method, 'params': params}))
+            return await asyncio.wait_for(fut, timeout=10)
+        finally:
+            self._pending.pop(req_id, None)
+
+    def _send_query(self, method: str, path: str, query: bytes):
+        ws_method = _WS_METHODS.get((method.upper(), path))
+        if ws_method is None:
+            return super()._send_query(method, path, query)
+
+        # WebSocket API signatures cover all params (apiKey included) sorted by name
+        params = dict(parse_qsl(query.decode('ascii')))
+        params['apiKey'] = self.api_key
+        params['timestamp'] = self._get_timestamp()
+        payload = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+        params['signature'] = self._sign_bytes(payload.encode('ascii'))
+
+        logger.debug("REQUEST -> WS %s %s | params: %s", ws_method, self.ws_url, payload)
+        try:
+            resp = asyncio.run_coroutine_threadsafe(self._request(ws_method, params), self._loop).result()
+        except Exception as e:
+            logger.error(f"Network/Error: {e}")
+            raise
+
+        logger.debug("RESPONSE [%s] -> %s", resp.get('status'), resp)
+        if resp.get('status') != 200:
+            err = resp.get('error', resp)
+            logger.error(f"WebSocket API error: {resp.get('status')} | response: {err}")
+            raise RuntimeError(f"WebSocket API error {resp.get('status')}: {err}")
+        return resp['result']
+
+    def close(self):
+        if self._ws is not None:
+            asyncio.run_coroutine_threadsafe(self._ws.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
 
 
 # --- CLI and Validation ---
 
+def valid_symbol(s: str) -> str:
+    s = s.strip().upper()
+    if not SYMBOL_RE.fullmatch(s):
+        raise argparse.ArgumentTypeError("symbol must contain only letters and digits, e.g. BTCUSDT")
+    return s
+
+
 def valid_side(s: str) -> str:
     s = s.upper()
     if s not in ('BUY', 'SELL'):
@@ -175,7 +611,9 @@ def positive_number(x: str) -> float:
     return v
 
 
+@functools.lru_cache(maxsize=1)
 def build_parser():
+    # Built once per process; for many orders prefer the `batch` command over one process per order
     p = argparse.ArgumentParser(description='Simplified Binance Futures Trading Bot (Testnet)')
     p.add_argument('--api-key', help='Binance API Key (or set BINANCE_API_KEY env var)')
     p.add_argument('--api-secret', help='Binance API Secret (or set BINANCE_API_SECRET env var)')
@@ -184,13 +622,13 @@ def build_parser():
 
     # Market
     mkt = sub.add_parser('market', help='Place a market order')
-    mkt.add_argument('--symbol', required=True, help='Trading pair, e.g., BTCUSDT')
+    mkt.add_argument('--symbol', required=True, type=valid_symbol, help='Trading pair, e.g., BTCUSDT')
     mkt.add_argument('--side', required=True, type=valid_side, help='BUY or SELL')
     mkt.add_argument('--quantity', required=True, type=positive_number, help='Quantity in contract units')
 
     # Limit
     lim = sub.add_parser('limit', help='Place a limit order')
-    lim.add_argument('--symbol', required=True)
+    lim.add_argument('--symbol', required=True, type=valid_symbol)
     lim.add_argument('--side', required=True, type=valid_side)
     lim.add_argument('--quantity', required=True, type=positive_number)
     lim.add_argument('--price', required=True, type=positive_number)
@@ -198,17 +636,73 @@ def build_parser():
 
     # Stop-Limit (bonus)
     stop = sub.add_parser('stop_limit', help='Place a stop-limit order (stopPrice + price)')
-    stop.add_argument('--symbol', required=True)
+    stop.add_argument('--symbol', required=True, type=valid_symbol)
     stop.add_argument('--side', required=True, type=valid_side)
     stop.add_argument('--quantity', required=True, type=positive_number)
     stop.add_argument('--stop-price', required=True, type=positive_number)
     stop.add_argument('--price', required=True, type=positive_number)
     stop.add_argument('--time-in-force', default='GTC', choices=['GTC', 'IOC', 'FOK'])
 
+    # Batch
+    batch = sub.add_parser('batch', help='Place many orders concurrently from a CSV file')
+    batch.add_argument('--file', required=True, help='CSV with columns symbol,side,type,quantity,price,stop')
+
     return p
 
 
+def read_batch_file(path: str) -> list:
+    """Parse a batch CSV into order dicts for `BinanceFuturesAsync.place_orders_bulk`.
+
+    `type` is MARKET, LIMIT or STOP_LIMIT; `price` is required for LIMIT and
+    STOP_LIMIT rows and `stop` for STOP_LIMIT rows.
+    """
+    orders = []
+    with open(path, newline='') as f:
+        for line, row in enumerate(csv.DictReader(f), start=2):
+            try:
+                order_type = row['type'].strip().upper().replace('-', '_')
+                order = {
+                    'type': order_type,
+                    'symbol': valid_symbol(row['symbol'] or ''),
+                    'side': valid_side(row['side'].strip()),
+                    'quantity': positive_number(row['quantity'] or ''),
+                }
+                if order_type in ('LIMIT', 'STOP_LIMIT'):
+                    order['price'] = positive_number(row.get('price') or '')
+                if order_type == 'STOP_LIMIT':
+                    order['stopPrice'] = positive_number(row.get('stop') or '')
+                elif order_type not in ('MARKET', 'LIMIT'):
+                    raise argparse.ArgumentTypeError(f"unknown order type {row['type']!r}")
+            except (KeyError, AttributeError, argparse.ArgumentTypeError) as e:
+                raise ValueError(f"{path}:{line}: invalid order row ({e})") from None
+            orders.append(order)
+    return orders
+
+
+async def _run_batch(client, orders):
+    async with client:
+        return await client.place_orders_bulk(orders)
+
+
+def run_batch(api_key: str, api_secret: str, path: str):
+    orders = read_batch_file(path)
+    logger.info(f"Placing {len(orders)} orders from {path}")
+    results = asyncio.run(_run_batch(BinanceFuturesAsync(api_key, api_secret), orders))
+
+    print('\n--- BATCH RESULT ---')
+    for order, resp in zip(orders, results):
+        desc = f"{order['type']} {order['side']} {order['symbol']} qty={order['quantity']}"
+        if isinstance(resp, Exception):
+            logger.error(f"Failed to place order {desc}: {resp}")
+            print(f"{desc}: FAILED ({resp})")
+        else:
+            logger.info(f"Order {desc}: {resp}")
+            print(f"{desc}: orderId={resp.get('orderId')} status={resp.get('status')}")
+    print('--------------------\n')
+
+
 def main():
+    _configure_logging()
     parser = build_parser()
     args = parser.parse_args()
 
@@ -219,6 +713,13 @@ def main():
         parser.print_help()
         return
 
+    if args.command == 'batch':
+        try:
+            run_batch(api_key, api_secret, args.file)
+        except Exception as e:
+            logger.exception(f"Failed to place batch: {e}")
+        return
+
     client = BinanceFuturesRest(api_key, api_secret)
 
     try:
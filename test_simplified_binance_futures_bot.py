@@ -0,0 +1,365 @@
+import argparse
+import asyncio
+import hashlib
+import hmac
+import logging
+import threading
+import time
+from urllib.parse import parse_qs, urlencode
+
+import pytest
+
+import simplified_binance_futures_bot as bot
+
+
+@pytest.fixture(autouse=True)
+def no_log_file():
+    # A handler on the bot logger makes _configure_logging a no-op, so tests don't write bot.log
+    handler = logging.NullHandler()
+    bot.logger.addHandler(handler)
+    yield
+    bot.logger.removeHandler(handler)
+
+
+class _FakeResponse:
+    status = 200
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def read(self):
+        return b'{"orderId": 1, "status": "NEW"}'
+
+    def raise_for_status(self):
+        pass
+
+
+class _FakeSession:
+    def __init__(self):
+        self.sent = []  # (local send time in ms, body)
+
+    async def request(self, method, url, data=None):
+        self.sent.append((time.time() * 1000, data))
+        return _FakeResponse()
+
+
+def test_bulk_orders_are_timestamped_when_sent():
+    client = bot.BinanceFuturesAsync('key', 'secret', base_url='https://bulk.test')
+    session = _FakeSession()
+    client._get_aio_session = lambda: session
+    client._limiter = bot._RateLimiter(rate=2, period=0.05)
+    client._sync_time_offset = lambda: 0
+    client._symbol_precision = lambda symbol: (None, None)
+
+    orders = [{'type': 'MARKET', 'symbol': 'BTCUSDT', 'side': 'BUY', 'quantity': 0.001}] * 10
+    results = asyncio.run(client.place_orders_bulk(orders))
+
+    assert [r['orderId'] for r in results] == [1] * 10
+    assert len(session.sent) == 10
+    for sent_at, body in session.sent:
+        timestamp = int(parse_qs(body.decode('ascii'))['timestamp'][0])
+        # Without stamping at send time the last orders would be ~200 ms old here
+        assert sent_at - timestamp < 40
+
+
+class _BlockingResponse:
+    status_code = 200
+
+    def __init__(self, content):
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+
+class _RecordingClient:
+    """Stands in for the blocking httpx client and records which thread each GET runs on."""
+
+    def __init__(self):
+        self.threads = []
+
+    def get(self, url, **kwargs):
+        self.threads.append(threading.get_ident())
+        if url.endswith(bot.API_TIME_PATH):
+            return _BlockingResponse(b'{"serverTime": %d}' % int(time.time() * 1000))
+        return _BlockingResponse(b'{"symbols": []}')
+
+
+def test_async_client_keeps_blocking_lookups_off_the_event_loop(monkeypatch):
+    monkeypatch.setattr(bot, '_CACHE', bot._TTLCache())
+    client = bot.BinanceFuturesAsync('key', 'secret', base_url='https://cold.test')
+    blocking = _RecordingClient()
+    client._client = blocking
+    client._get_aio_session = lambda: _FakeSession()
+    client._limiter = bot._RateLimiter()
+
+    async def place():
+        loop_thread = threading.get_ident()
+        resp = await client.place_market_order('BTCUSDT', 'BUY', 0.001)
+        return loop_thread, resp
+
+    loop_thread, resp = asyncio.run(place())
+    assert resp['orderId'] == 1
+    assert len(blocking.threads) == bot.TIME_SYNC_SAMPLES + 1  # time samples + exchangeInfo
+    assert loop_thread not in blocking.threads
+
+
+class _CapturingClient:
+    """Stands in for the blocking httpx client and records signed order requests."""
+
+    def __init__(self):
+        self.requests = []
+
+    def request(self, method, url, content=None, headers=None, timeout=None):
+        self.requests.append((method, url, content))
+        return _BlockingResponse(b'{"orderId": 1}')
+
+
+def _baseline_body(payload, timestamp):
+    # How bodies were built before the string templates: urlencode, sign, urlencode again
+    payload = dict(payload, timestamp=timestamp)
+    signature = hmac.new(b'secret', urlencode(payload).encode('utf-8'), hashlib.sha256).hexdigest()
+    payload['signature'] = signature
+    return urlencode(payload).encode('ascii')
+
+
+@pytest.mark.parametrize('method, args, payload', [
+    ('place_market_order', ('BTCUSDT', 'BUY', 0.001), {
+        'symbol': 'BTCUSDT', 'side': 'BUY', 'type': 'MARKET', 'quantity': '0.001000', 'reduceOnly': 'false',
+    }),
+    ('place_limit_order', ('BTCUSDT', 'SELL', 0.002, 70000.5), {
+        'symbol': 'BTCUSDT', 'side': 'SELL', 'type': 'LIMIT', 'timeInForce': 'GTC',
+        'quantity': '0.002000', 'price': '70000.500000', 'reduceOnly': 'false',
+    }),
+    ('place_stop_limit_order', ('BTCUSDT', 'SELL', 0.002, 68800, 69000), {
+        'symbol': 'BTCUSDT', 'side': 'SELL', 'type': 'STOP', 'quantity': '0.002000',
+        'stopPrice': '68800.000000', 'price': '69000.000000', 'timeInForce': 'GTC', 'reduceOnly': 'false',
+    }),
+])
+def test_rest_order_body_matches_urlencoded_baseline(method, args, payload):
+    client = bot.BinanceFuturesRest('key', 'secret', base_url='https://rest.test')
+    capture = _CapturingClient()
+    client._client = capture
+    client._get_timestamp = lambda: 1730008338402
+    client._symbol_precision = lambda symbol: (None, None)
+
+    assert getattr(client, method)(*args) == {'orderId': 1}
+    assert capture.requests == [
+        ('POST', 'https://rest.test' + bot.API_ORDER_PATH, _baseline_body(payload, 1730008338402)),
+    ]
+
+
+def test_failed_time_sync_is_retried_after_short_ttl(monkeypatch):
+    monkeypatch.setattr(bot, '_CACHE', bot._TTLCache())
+    monkeypatch.setattr(bot, 'FAILED_LOOKUP_TTL', 0.2)
+    client = bot.BinanceFuturesRest('key', 'secret', base_url='https://time.test')
+    calls = []
+
+    def failing_sync():
+        calls.append(1)
+        raise ConnectionError("server time unavailable")
+
+    client._sync_time_offset = failing_sync
+    before = int(time.time() * 1000)
+    assert client._get_timestamp() >= before  # falls back to local time
+    client._get_timestamp()
+    assert len(calls) == 1  # failure is cached briefly...
+
+    time.sleep(0.25)
+    client._sync_time_offset = lambda: 1000
+    assert client._get_timestamp() >= before + 1000  # ...and retried once it expires
+
+
+@pytest.mark.parametrize('step, expected', [
+    ('0.00100000', 3),
+    ('0.10', 1),
+    ('1', 0),
+    ('10.000', 0),
+    (None, None),
+    ('', None),
+])
+def test_decimals(step, expected):
+    assert bot._decimals(step) == expected
+
+
+@pytest.mark.parametrize('quantity, expected', [
+    (0.001, '0.001'),
+    (0.002, '0.002'),
+    (1, '1.000'),
+])
+def test_fmt_qty_keeps_quantities_on_step(quantity, expected):
+    assert bot.BinanceFuturesRest._fmt_qty(quantity, '0.00100000') == expected
+
+
+@pytest.mark.parametrize('quantity', [0.0015, 0.0004, 0.0029999])
+def test_fmt_qty_rejects_quantities_off_step(quantity):
+    with pytest.raises(ValueError):
+        bot.BinanceFuturesRest._fmt_qty(quantity, '0.001')
+
+
+def test_fmt_price_keeps_prices_on_tick():
+    assert bot.BinanceFuturesRest._fmt_price(68000, '0.10') == '68000.0'
+    assert bot.BinanceFuturesRest._fmt_price(69000.1, '0.10') == '69000.1'
+    assert bot.BinanceFuturesRest._fmt_price(0.001, None) == '0.001000'
+
+
+@pytest.mark.parametrize('price', [69000.05, 67999.99])
+def test_fmt_price_rejects_prices_off_tick(price):
+    with pytest.raises(ValueError):
+        bot.BinanceFuturesRest._fmt_price(price, '0.10')
+
+
+def test_failed_exchange_info_is_cached_briefly(monkeypatch):
+    monkeypatch.setattr(bot, '_CACHE', bot._TTLCache())
+    client = bot.BinanceFuturesRest('key', 'secret', base_url='https://info.test')
+    calls = []
+
+    class FailingClient:
+        def get(self, url, **kwargs):
+            calls.append(url)
+            raise ConnectionError("exchangeInfo unavailable")
+
+    client._client = FailingClient()
+    assert client._symbol_precision('BTCUSDT') == (None, None)
+    assert client._symbol_precision('ETHUSDT') == (None, None)
+    assert len(calls) == 1
+
+
+def test_symbol_precision_caches_only_the_filter_map(monkeypatch):
+    monkeypatch.setattr(bot, '_CACHE', bot._TTLCache())
+    client = bot.BinanceFuturesRest('key', 'secret', base_url='https://info.test')
+    info = (b'{"symbols": [{"symbol": "BTCUSDT", "filters": ['
+            b'{"filterType": "PRICE_FILTER", "tickSize": "0.10"},'
+            b'{"filterType": "LOT_SIZE", "stepSize": "0.001"}]}]}')
+
+    class InfoResponse:
+        content = info
+
+        def raise_for_status(self):
+            pass
+
+    class InfoClient:
+        def get(self, url, **kwargs):
+            return InfoResponse()
+
+    client._client = InfoClient()
+    assert client._symbol_precision('BTCUSDT') == ('0.001', '0.10')
+    assert client._symbol_precision('ETHUSDT') == (None, None)
+    assert list(bot._CACHE._data) == [('https://info.test', 'precision')]
+
+
+def _write_csv(tmp_path, text):
+    path = tmp_path / 'orders.csv'
+    path.write_text(text)
+    return str(path)
+
+
+@pytest.mark.parametrize('symbol, expected', [
+    ('BTCUSDT', 'BTCUSDT'),
+    (' btcusdt ', 'BTCUSDT'),
+    ('1000PEPEUSDT', '1000PEPEUSDT'),
+])
+def test_valid_symbol(symbol, expected):
+    assert bot.valid_symbol(symbol) == expected
+
+
+@pytest.mark.parametrize('symbol', ['', 'BTC USDT', 'BTCUSDT&price=1', 'BTC/USDT', 'БTCUSDT'])
+def test_valid_symbol_rejects_unsafe_input(symbol):
+    with pytest.raises(argparse.ArgumentTypeError):
+        bot.valid_symbol(symbol)
+
+
+def test_read_batch_file(tmp_path):
+    path = _write_csv(tmp_path, (
+        "symbol,side,type,quantity,price,stop\n"
+        "btcusdt,buy,market,0.001,,\n"
+        "BTCUSDT,SELL,LIMIT,0.002,70000,\n"
+        "BTCUSDT,SELL,stop-limit,0.002,69000,68800\n"
+    ))
+    assert bot.read_batch_file(path) == [
+        {'type': 'MARKET', 'symbol': 'BTCUSDT', 'side': 'BUY', 'quantity': 0.001},
+        {'type': 'LIMIT', 'symbol': 'BTCUSDT', 'side': 'SELL', 'quantity': 0.002, 'price': 70000.0},
+        {'type': 'STOP_LIMIT', 'symbol': 'BTCUSDT', 'side': 'SELL', 'quantity': 0.002,
+         'price': 69000.0, 'stopPrice': 68800.0},
+    ]
+
+
+@pytest.mark.parametrize('row', [
+    "BTCUSDT,BUY,LIMIT,0.002,,",          # LIMIT without price
+    "BTCUSDT,BUY,STOP_LIMIT,0.002,69000,",  # STOP_LIMIT without stop
+    "BTCUSDT,HOLD,MARKET,0.001,,",        # bad side
+    "BTCUSDT,BUY,MARKET,-1,,",            # non-positive quantity
+    "BTCUSDT,BUY,TRAILING,0.001,,",       # unknown type
+    "BTCUSDT,BUY,MARKET",                 # missing quantity column
+    "BTCUSDT&price=1,BUY,MARKET,0.001,,", # symbol that would inject a parameter
+])
+def test_read_batch_file_reports_bad_rows_with_line_number(tmp_path, row):
+    path = _write_csv(tmp_path, "symbol,side,type,quantity,price,stop\nBTCUSDT,BUY,MARKET,0.001,,\n" + row + "\n")
+    with pytest.raises(ValueError, match=r"orders\.csv:3: invalid order row"):
+        bot.read_batch_file(path)
+
+
+def test_ws_order_is_signed_over_sorted_params():
+    client = bot.BinanceFuturesWS('key', 'secret', base_url='https://ws.test')
+    client._sync_time_offset = lambda: 0
+    client._symbol_precision = lambda symbol: ('0.001', '0.10')
+    sent = []
+
+    async def fake_request(ws_method, params):
+        sent.append((ws_method, dict(params)))
+        return {'id': 'x', 'status': 200, 'result': {'orderId': 7}}
+
+    client._request = fake_request
+    try:
+        assert client.place_limit_order('BTCUSDT', 'BUY', 0.001, 68000) == {'orderId': 7}
+    finally:
+        client.close()
+
+    ws_method, params = sent[0]
+    assert ws_method == 'order.place'
+    assert params['apiKey'] == 'key'
+    assert params['price'] == '68000.0'
+    signature = params.pop('signature')
+    payload = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+    assert signature == hmac.new(b'secret', payload.encode('ascii'), hashlib.sha256).hexdigest()
+
+
+def test_ttl_cache_expires_and_evicts_least_recently_used():
+    cache = bot._TTLCache(maxsize=2)
+    assert cache.get_or_fetch('a', 60, lambda: 1) == 1
+    assert cache.get_or_fetch('a', 60, lambda: 2) == 1  # cached
+    cache.get_or_fetch('b', 60, lambda: 'b')
+    cache.get_or_fetch('a', 60, lambda: 3)  # touch 'a' so 'b' is least recently used
+    cache.get_or_fetch('c', 60, lambda: 'c')
+    assert cache.get_or_fetch('b', 60, lambda: 'b2') == 'b2'  # evicted and refetched
+    assert cache.get_or_fetch('c', 60, lambda: 'c2') == 'c'  # still cached
+
+    cache.put('d', 'old', 0)
+    assert cache.get_or_fetch('d', 60, lambda: 'new') == 'new'  # expired
+
+
+def _expected_signature(query):
+    return hmac.new(b'secret', query, hashlib.sha256).hexdigest()
+
+
+def test_sign_bytes_with_stdlib_hmac(monkeypatch):
+    monkeypatch.setattr(bot, 'chmac', None)
+    client = bot.BinanceFuturesRest('key', 'secret')
+    query = b'symbol=BTCUSDT&side=BUY&type=MARKET&quantity=0.001&timestamp=1730008338402'
+    assert client._sign_bytes(query) == _expected_signature(query)
+    assert client._sign_bytes(query) == _expected_signature(query)  # template reusable
+
+
+def test_sign_bytes_with_cryptography_hmac(monkeypatch):
+    pytest.importorskip('cryptography')
+    from cryptography.hazmat.primitives import hashes, hmac as chmac
+    monkeypatch.setattr(bot, 'chmac', chmac)
+    monkeypatch.setattr(bot, 'hashes', hashes, raising=False)
+    client = bot.BinanceFuturesRest('key', 'secret')
+    assert isinstance(client._hmac_template, chmac.HMAC)
+    query = b'symbol=BTCUSDT&side=BUY&type=MARKET&quantity=0.001&timestamp=1730008338402'
+    assert client._sign_bytes(query) == _expected_signature(query)
+    assert client._sign_bytes(query) == _expected_signature(query)  # template reusable